@@ -0,0 +1,99 @@
+"""
+Local stand-in for the Gemini API and the product image host, used by the load tests.
+
+- POST /v1beta/models/<model>:generateContent returns a canned description after a
+  configurable delay, in the response shape google-genai expects.
+- GET /images/<anything> returns a fixed-size JPEG-typed payload.
+
+Run standalone with `python -m loadtest.fake_gemini --port 8200`, then start the API with
+GEMINI_BASE_URL=http://127.0.0.1:8200 and GEMINI_API_KEY set to any value.
+"""
+import argparse
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FAKE_DESCRIPTION = (
+    "A plush hand-knotted rug in deep navy blue with ivory cream accents. "
+    "A centered medallion is framed by a layered floral border, and the low, even pile "
+    "has a soft matte finish with a subtle sheen where the light catches the wool."
+)
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, gemini_latency: float, image_latency: float, image_bytes: int):
+        super().__init__(address, _Handler)
+        self.gemini_latency = gemini_latency
+        self.image_latency = image_latency
+        # JPEG SOI marker followed by filler; the API only forwards the bytes, it never decodes them.
+        self.image_payload = b"\xff\xd8\xff\xe0" + bytes(max(image_bytes - 4, 0))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # keep load-test output readable
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _sleep(self, mean: float) -> None:
+        if mean > 0:
+            time.sleep(random.uniform(0.5 * mean, 1.5 * mean))
+
+    def do_GET(self):
+        if not self.path.startswith("/images/"):
+            self._send(404, b"not found", "text/plain")
+            return
+        self._sleep(self.server.image_latency)
+        self._send(200, self.server.image_payload, "image/jpeg")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if ":generateContent" not in self.path:
+            self._send(404, b"not found", "text/plain")
+            return
+        self._sleep(self.server.gemini_latency)
+        body = {
+            "candidates": [
+                {
+                    "content": {"role": "model", "parts": [{"text": FAKE_DESCRIPTION}]},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }
+            ],
+            "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": 0, "totalTokenCount": 0},
+        }
+        self._send(200, json.dumps(body).encode("utf-8"), "application/json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8200)
+    parser.add_argument("--gemini-latency", type=float, default=0.3, help="Mean seconds per Gemini call.")
+    parser.add_argument("--image-latency", type=float, default=0.02, help="Mean seconds per image fetch.")
+    parser.add_argument("--image-bytes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    server = FakeGeminiServer(
+        (args.host, args.port), args.gemini_latency, args.image_latency, args.image_bytes
+    )
+    print(f"Fake Gemini/image server on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Load-test /search, /ingest and /generate_description at rising concurrency.
+
+Starts the fake Gemini/image server in its own process, seeds a synthetic catalog, and
+launches the API (INFO logging to a file, as in production) against a throwaway copy of the
+catalog with Gemini pointed at the fake server. Reports p50/p99 latency and requests per
+second per route and concurrency level, followed by the per-stage histograms from /metrics.
+
+Run from `Sematic_based/`:  python -m loadtest.run --products 100000 --concurrency 1,2,4,8,16,32
+"""
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+import requests
+
+from loadtest.seed_catalog import DEFAULT_CHROMA_DIR, synthetic_product, synthetic_query
+
+ROUTES = ("search", "ingest", "generate_description")
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of `samples` (q in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _payload_factory(route: str, image_base: str, seed: int) -> Callable[[], Dict[str, object]]:
+    rng = random.Random(seed)
+    lock = threading.Lock()
+    counter = [10_000_000]  # keep ingested product numbers clear of the seeded catalog
+
+    def make() -> Dict[str, object]:
+        with lock:
+            if route == "search":
+                return {"query": synthetic_query(rng), "top_k": 5}
+            counter[0] += 1
+            product = synthetic_product(rng, image_base, counter[0])
+        if route == "generate_description":
+            product.pop("description")
+        return product
+
+    return make
+
+
+def run_level(api_base: str, route: str, concurrency: int, total: int, make_payload) -> Dict[str, object]:
+    local = threading.local()
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def one(_):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        payload = make_payload()
+        start = time.perf_counter()
+        try:
+            resp = session.post(f"{api_base}/{route}", json=payload, timeout=120)
+            ok = resp.status_code == 200
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors[0] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    wall = time.perf_counter() - start
+
+    return {
+        "route": route,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors[0],
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "rps": len(latencies) / wall if wall else 0.0,
+    }
+
+
+def _wait_for(url: str, proc: subprocess.Popen, name: str, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{name} exited early with code {proc.returncode}")
+        try:
+            if requests.get(url, timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"{name} did not come up within {timeout:.0f}s")
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=100_000, help="Synthetic catalog size.")
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32", help="Comma-separated levels.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route and level.")
+    parser.add_argument("--routes", default=",".join(ROUTES))
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per route.")
+    parser.add_argument(
+        "--chroma-dir", default=DEFAULT_CHROMA_DIR,
+        help="Seeded catalog; each run serves a temporary copy so /ingest never mutates it.",
+    )
+    parser.add_argument("--log-file", default="loadtest-api.log", help="API log output (truncated per run).")
+    parser.add_argument("--api-port", type=int, default=8100)
+    parser.add_argument("--fake-port", type=int, default=8200)
+    parser.add_argument("--gemini-latency", type=float, default=0.3)
+    parser.add_argument("--image-latency", type=float, default=0.02)
+    parser.add_argument("--log-sample-rate", default="0.01")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="Write the results and final /metrics snapshot as JSON.")
+    args = parser.parse_args()
+
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+    fake_base = f"http://127.0.0.1:{args.fake_port}"
+    api_base = f"http://127.0.0.1:{args.api_port}"
+
+    # Seed in its own process so only the API holds a Chroma directory open during the run.
+    subprocess.run(
+        [sys.executable, "-m", "loadtest.seed_catalog", "--products", str(args.products),
+         "--image-base", fake_base, "--seed", str(args.seed), "--chroma-dir", args.chroma_dir],
+        check=True,
+    )
+    run_dir = tempfile.mkdtemp(prefix="chroma-loadtest-run-")
+    shutil.copytree(args.chroma_dir, run_dir, dirs_exist_ok=True)
+    if os.path.exists(args.log_file):
+        os.remove(args.log_file)
+
+    # The fake server runs in its own process so it doesn't share the GIL with the client threads.
+    fake = subprocess.Popen(
+        [sys.executable, "-m", "loadtest.fake_gemini", "--port", str(args.fake_port),
+         "--gemini-latency", str(args.gemini_latency), "--image-latency", str(args.image_latency)],
+    )
+    api = subprocess.Popen(
+        [sys.executable, "-m", "loadtest.serve_api", "--port", str(args.api_port),
+         "--log-file", args.log_file],
+        env=dict(
+            os.environ,
+            CHROMA_DIR=run_dir,
+            GEMINI_API_KEY="loadtest",
+            GEMINI_BASE_URL=fake_base,
+            LOG_PAYLOAD_SAMPLE_RATE=args.log_sample_rate,
+        ),
+    )
+    results: List[Dict[str, object]] = []
+    try:
+        _wait_for(f"{fake_base}/images/probe.jpg", fake, "Fake Gemini server")
+        _wait_for(f"{api_base}/metrics", api, "API")
+        print(f"{'route':<22}{'conc':>6}{'reqs':>7}{'errs':>6}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>9}")
+        for route in routes:
+            make_payload = _payload_factory(route, fake_base, args.seed)
+            run_level(api_base, route, 1, args.warmup, make_payload)
+            for concurrency in levels:
+                row = run_level(api_base, route, concurrency, args.requests, make_payload)
+                results.append(row)
+                print(
+                    f"{route:<22}{concurrency:>6}{row['requests']:>7}{row['errors']:>6}"
+                    f"{row['p50_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['rps']:>9.1f}"
+                )
+
+        snapshot = requests.get(f"{api_base}/metrics", timeout=10).json()
+        print(f"\n{'stage':<22}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}")
+        for stage, hist in snapshot["stages"].items():
+            print(f"{stage:<22}{hist['count']:>8}{hist['p50'] * 1000:>10.3f}{hist['p99'] * 1000:>10.3f}")
+        print(f"\nlog payloads: {snapshot['log_payloads']}")
+        print(f"log file: {args.log_file} ({os.path.getsize(args.log_file)} bytes)")
+
+        if args.output:
+            with open(args.output, "w") as fh:
+                json.dump({"results": results, "metrics": snapshot}, fh, indent=2)
+    finally:
+        _stop(api)
+        _stop(fake)
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Seed a load-test Chroma directory with a reproducible synthetic rug catalog.
+
+Products are stored in the same shape as `ingest_product` writes them, with image URLs
+pointing at the fake image host. A manifest next to the Chroma data records what was seeded;
+a catalog that does not match it exactly is dropped and reseeded. A non-empty catalog without
+a manifest is never dropped, so the app's own store cannot be wiped by mistake.
+Run with `python -m loadtest.seed_catalog --products 100000` (defaults to `.chroma-loadtest`).
+"""
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict, List
+
+from src.vector_store import get_chroma_client, get_collection, get_embedding_function
+
+COLORS = [
+    "navy", "ivory", "terracotta", "sage green", "charcoal", "rust", "blush pink",
+    "mustard", "slate blue", "burgundy", "cream", "teal", "sand", "olive", "graphite",
+]
+PATTERNS = [
+    "medallion", "geometric", "floral", "trellis", "distressed", "striped", "chevron",
+    "paisley", "abstract", "tribal", "solid", "border-framed",
+]
+STYLES = ["Persian", "Moroccan", "Scandinavian", "bohemian", "mid-century", "rustic", "modern", "oriental"]
+MATERIALS = ["wool", "silk", "jute", "cotton", "polypropylene", "viscose"]
+TEXTURES = ["plush high-pile", "flat-weave", "low-pile", "shaggy", "hand-knotted", "hand-tufted"]
+SIZES = ["2x3", "4x6", "5x8", "8x10", "9x12", "runner 2.5x8"]
+
+MANIFEST_NAME = "loadtest_seed.json"
+DEFAULT_CHROMA_DIR = ".chroma-loadtest"
+
+
+class SeedCatalogError(RuntimeError):
+    pass
+
+
+def synthetic_product(rng: random.Random, image_base: str, product_no: int) -> Dict[str, object]:
+    """Build one product in the request shape accepted by /ingest."""
+    primary, secondary = rng.sample(COLORS, 2)
+    pattern = rng.choice(PATTERNS)
+    style = rng.choice(STYLES)
+    material = rng.choice(MATERIALS)
+    texture = rng.choice(TEXTURES)
+    size = rng.choice(SIZES)
+    name = f"{style.title()} {pattern.title()} {material.title()} Rug {size} #{product_no}"
+    description = (
+        f"A {texture} {material} rug in {primary} with {secondary} accents. "
+        f"The {pattern} design reads as {style}, with a {rng.choice(['subtle', 'bold', 'muted', 'vivid'])} "
+        f"contrast between field and border and a {rng.choice(['matte', 'soft sheen', 'silky luster'])} finish. "
+        f"Sized {size} feet."
+    )
+    image_urls = [
+        f"{image_base}/images/{product_no}-{k}.jpg" for k in range(rng.randint(1, 3))
+    ]
+    return {
+        "name": name,
+        "keywords": [primary, secondary, pattern, style, material],
+        "image_urls": image_urls,
+        "description": description,
+    }
+
+
+def synthetic_query(rng: random.Random) -> str:
+    return rng.choice([
+        f"{rng.choice(COLORS)} {rng.choice(PATTERNS)} rug",
+        f"{rng.choice(STYLES)} {rng.choice(MATERIALS)} rug for the living room",
+        f"{rng.choice(TEXTURES)} rug in {rng.choice(COLORS)} and {rng.choice(COLORS)}",
+        rng.choice(PATTERNS),
+    ])
+
+
+def seed_catalog(
+    chroma_dir: str,
+    products: int,
+    image_base: str,
+    seed: int = 1234,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Make the collection in `chroma_dir` hold exactly `products` synthetic items generated
+    from `seed`. Returns the number of items written (0 if the catalog already matched).
+    """
+    manifest = {"products": products, "image_base": image_base, "seed": seed}
+    manifest_path = os.path.join(chroma_dir, MANIFEST_NAME)
+    client = get_chroma_client(chroma_dir)
+    collection = get_collection(client)
+    try:
+        with open(manifest_path) as fh:
+            seeded = json.load(fh)
+    except FileNotFoundError:
+        seeded = None
+    except (OSError, json.JSONDecodeError):
+        seeded = {}
+    if seeded == manifest and collection.count() == products:
+        return 0
+
+    if collection.count():
+        if seeded is None:
+            raise SeedCatalogError(
+                f"{chroma_dir} holds {collection.count()} products but no {MANIFEST_NAME}; "
+                "refusing to drop a catalog the load test did not create."
+            )
+        # Keep the old manifest until reseeding finishes, so an interrupted run can be redone.
+        client.delete_collection(collection.name)
+        collection = get_collection(client)
+    elif seeded is None:
+        # Claim the empty directory first, so an interrupted first seed can still be redone.
+        with open(manifest_path, "w") as fh:
+            json.dump({}, fh)
+
+    embed = get_embedding_function()
+    rng = random.Random(seed)
+    for start in range(0, products, batch_size):
+        ids: List[str] = []
+        documents: List[str] = []
+        metadatas: List[Dict[str, object]] = []
+        for product_no in range(start, min(start + batch_size, products)):
+            product = synthetic_product(rng, image_base, product_no)
+            ids.append(f"seed-{product_no:07d}")
+            documents.append(product["description"])
+            metadatas.append({
+                "name": product["name"],
+                "keywords": json.dumps(product["keywords"]),
+                "image_urls": json.dumps(product["image_urls"]),
+                "description": product["description"],
+            })
+        collection.upsert(
+            ids=ids,
+            embeddings=embed(documents),
+            documents=documents,
+            metadatas=metadatas,
+        )
+    with open(manifest_path, "w") as fh:
+        json.dump(manifest, fh)
+    return products
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chroma-dir", default=DEFAULT_CHROMA_DIR)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--image-base", default="http://127.0.0.1:8200")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        written = seed_catalog(
+            args.chroma_dir, args.products, args.image_base, args.seed, args.batch_size
+        )
+    except SeedCatalogError as exc:
+        raise SystemExit(str(exc)) from exc
+    if written:
+        print(f"Seeded {written} products in {time.perf_counter() - start:.1f}s")
+    else:
+        print(f"Catalog already matches {args.products} products from seed {args.seed}; skipping seed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Run the API for load tests with the same INFO logging as `src/app.py:main`, written to a
+file so log I/O is part of what is measured. Run with
+`python -m loadtest.serve_api --port 8100 --log-file loadtest-api.log`.
+"""
+import argparse
+
+import uvicorn
+
+from src.app import app, configure_logging
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--log-file", default="loadtest-api.log")
+    args = parser.parse_args()
+
+    configure_logging(args.log_file)
+    # Uvicorn's own loggers stay quiet; the app's `src.*` loggers keep INFO via the root logger.
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
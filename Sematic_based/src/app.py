@@ -4,6 +4,8 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 import uvicorn
 import logging
+import time
+from typing import Optional
 
 from src.schemas import (
     GenerateDescriptionRequest,
@@ -16,6 +18,7 @@ from src.schemas import (
 from src.ingestion import ingest_product
 from src.search import search_products
 from src.gemini_client import generate_description
+from src import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,23 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_route_latency(request: Request, call_next):
+    """
+    Record end-to-end latency per matched route (unmatched paths are not tracked) and
+    make one payload-logging sample decision for the whole request.
+    """
+    start = time.perf_counter()
+    with metrics.payload_sampling():
+        response = await call_next(request)
+    route = request.scope.get("route")
+    if route is not None:
+        metrics.observe_route(
+            f"{request.method} {route.path}", time.perf_counter() - start
+        )
+    return response
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors with detailed messages."""
@@ -49,8 +69,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 def ingest(payload: IngestRequest):
     try:
         logger.info(f"Ingesting product: {payload.name}")
-        logger.info(f"Keywords: {payload.keywords}")
-        logger.info(f"Image URLs: {[str(u) for u in payload.image_urls]}")
+        metrics.log_payload(logger, "Keywords: %s", payload.keywords)
+        metrics.log_payload(logger, "Image URLs: %s", [str(u) for u in payload.image_urls])
         logger.info(f"Description length: {len(payload.description)} chars")
         return ingest_product(payload)
     except ValueError as exc:
@@ -87,14 +107,25 @@ def generate_description_route(payload: GenerateDescriptionRequest):
         ) from exc
 
 
-def main():
-    """Launch the uvicorn server."""
-    # Configure logging
+@app.get("/metrics")
+def metrics_route():
+    """Per-route and per-stage latency histograms plus log-payload sampling counters."""
+    return metrics.snapshot()
+
+
+def configure_logging(filename: Optional[str] = None):
+    """Configure INFO logging for the app, to stderr or to `filename` if given."""
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
+        filename=filename,
     )
+
+
+def main():
+    """Launch the uvicorn server."""
+    configure_logging()
     
     uvicorn.run(
         "src.app:app",
@@ -6,6 +6,8 @@ from google import genai
 from google.genai import types
 import requests
 
+from src.metrics import log_payload, payload_sampling, timed
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,13 +19,18 @@ def _get_client() -> genai.Client:
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise GeminiError("GEMINI_API_KEY is not set.")
+    # GEMINI_BASE_URL points the client at a compatible stand-in (e.g. the load-test fake server).
+    base_url = os.getenv("GEMINI_BASE_URL")
+    if base_url:
+        return genai.Client(api_key=api_key, http_options=types.HttpOptions(base_url=base_url))
     return genai.Client(api_key=api_key)
 
 
 def _fetch_image_bytes(url: str) -> bytes:
-    resp = requests.get(url, timeout=10)
-    resp.raise_for_status()
-    return resp.content
+    with timed("image_fetch"):
+        resp = requests.get(url, timeout=10)
+        resp.raise_for_status()
+        return resp.content
 
 
 def generate_description(image_urls: List[str], name: str, keywords: List[str]) -> str:
@@ -31,6 +38,12 @@ def generate_description(image_urls: List[str], name: str, keywords: List[str])
     Uses Gemini to draft a product description based on images, name, and keywords.
     Processes each image individually, then collates all descriptions into one.
     """
+    # Within a request this reuses the request's decision; direct calls sample once per call.
+    with payload_sampling():
+        return _generate_description(image_urls, name, keywords)
+
+
+def _generate_description(image_urls: List[str], name: str, keywords: List[str]) -> str:
     client = _get_client()
     
     # Individual image description prompt - focused on visual/aesthetic details
@@ -54,19 +67,20 @@ def generate_description(image_urls: List[str], name: str, keywords: List[str])
     # Process each image individually
     individual_descriptions = []
     for idx, url in enumerate(image_urls, 1):
-        logger.info(f"[Image {idx}/{len(image_urls)}] Processing image: {url}")
+        logger.debug(f"[Image {idx}/{len(image_urls)}] Processing image: {url}")
         
         try:
             img_bytes = _fetch_image_bytes(url)
             image_part = types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
             
-            logger.info(f"[Image {idx}/{len(image_urls)}] Input - URL: {url}")
-            logger.info(f"[Image {idx}/{len(image_urls)}] Input - Prompt: {individual_prompt}")
+            log_payload(logger, "[Image %d/%d] Input - URL: %s", idx, len(image_urls), url)
+            log_payload(logger, "[Image %d/%d] Input - Prompt: %s", idx, len(image_urls), individual_prompt)
             
-            result = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=[individual_prompt, image_part],
-            )
+            with timed("gemini_call"):
+                result = client.models.generate_content(
+                    model="gemini-2.5-flash",
+                    contents=[individual_prompt, image_part],
+                )
             
             if not result or not result.text:
                 raise GeminiError(f"No description returned by Gemini for image {idx}.")
@@ -74,14 +88,14 @@ def generate_description(image_urls: List[str], name: str, keywords: List[str])
             description = result.text.strip()
             individual_descriptions.append(description)
             
-            logger.info(f"[Image {idx}/{len(image_urls)}] Output - Description: {description}")
+            log_payload(logger, "[Image %d/%d] Output - Description: %s", idx, len(image_urls), description)
             
         except Exception as e:
             logger.error(f"[Image {idx}/{len(image_urls)}] Error processing {url}: {e}")
             raise
     
     # Collate all descriptions into one
-    logger.info(f"[Collation] Starting collation of {len(individual_descriptions)} descriptions")
+    logger.debug(f"[Collation] Starting collation of {len(individual_descriptions)} descriptions")
     
     collation_prompt = (
         "You are a visual description specialist for a premium rug/carpet retailer. "
@@ -107,18 +121,19 @@ def generate_description(image_urls: List[str], name: str, keywords: List[str])
         )
     )
     
-    logger.info(f"[Collation] Input - Prompt: {collation_prompt}")
+    log_payload(logger, "[Collation] Input - Prompt: %s", collation_prompt)
     
-    collation_result = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=[collation_prompt],
-    )
+    with timed("gemini_call"):
+        collation_result = client.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=[collation_prompt],
+        )
     
     if not collation_result or not collation_result.text:
         raise GeminiError("No collated description returned by Gemini.")
     
     final_description = collation_result.text.strip()
-    logger.info(f"[Collation] Output - Final Description: {final_description}")
+    log_payload(logger, "[Collation] Output - Final Description: %s", final_description)
     
     return final_description
 
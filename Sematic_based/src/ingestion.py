@@ -3,7 +3,8 @@ import json
 from typing import Dict
 
 from src.schemas import IngestRequest, IngestResponse
-from src.vector_store import get_chroma_client, get_collection
+from src.vector_store import get_chroma_client, get_collection, get_embedding_function
+from src.metrics import timed
 
 
 def ingest_product(payload: IngestRequest) -> IngestResponse:
@@ -24,11 +25,16 @@ def ingest_product(payload: IngestRequest) -> IngestResponse:
         "description": description,
     }
 
-    collection.add(
-        ids=[product_id],
-        documents=[description],
-        metadatas=[metadata],
-    )
+    with timed("embedding"):
+        embeddings = get_embedding_function()([description])
+
+    with timed("chroma_add"):
+        collection.add(
+            ids=[product_id],
+            embeddings=embeddings,
+            documents=[description],
+            metadatas=[metadata],
+        )
 
     # Return metadata with original list format (not JSON strings) for API response
     response_metadata: Dict[str, object] = {
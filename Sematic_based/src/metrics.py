@@ -0,0 +1,157 @@
+import logging
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended.
+# Sub-millisecond bounds resolve cheap stages such as validation and metadata parsing.
+BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, safe to update from multiple threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: List[int] = [0] * (len(BUCKETS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        idx = bisect_left(BUCKETS, seconds)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum += seconds
+            if seconds > self._max:
+                self._max = seconds
+
+    @staticmethod
+    def _quantile(counts: List[int], total: int, max_seen: float, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation, capped at the observed max.
+        rank = q * total
+        seen = 0
+        for idx, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return min(BUCKETS[idx], max_seen) if idx < len(BUCKETS) else max_seen
+        return 0.0
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+            max_seen = self._max
+        cumulative = 0
+        buckets: Dict[str, int] = {}
+        for bound, count in zip(list(BUCKETS) + [float("inf")], counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {
+            "count": total,
+            "sum": total_sum,
+            "max": max_seen,
+            "p50": self._quantile(counts, total, max_seen, 0.50),
+            "p99": self._quantile(counts, total, max_seen, 0.99),
+            "buckets": buckets,
+        }
+
+
+_registry_lock = threading.Lock()
+_routes: Dict[str, Histogram] = {}
+_stages: Dict[str, Histogram] = {}
+_log_payloads = {"sampled": 0, "dropped": 0}
+# Per-request (or per-call) decision on whether payloads are logged; None outside any scope.
+_payload_sampled: ContextVar[Optional[bool]] = ContextVar("payload_sampled", default=None)
+
+
+def _histogram(registry: Dict[str, Histogram], name: str) -> Histogram:
+    hist = registry.get(name)
+    if hist is None:
+        with _registry_lock:
+            hist = registry.setdefault(name, Histogram())
+    return hist
+
+
+def observe_route(route: str, seconds: float) -> None:
+    _histogram(_routes, route).observe(seconds)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    _histogram(_stages, stage).observe(seconds)
+
+
+@contextmanager
+def timed(stage: str):
+    """Record the wall time of the enclosed block under the given stage name."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def _payload_sample_rate() -> float:
+    try:
+        rate = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0.01"))
+    except ValueError:
+        return 0.01
+    return min(max(rate, 0.0), 1.0)
+
+
+@contextmanager
+def payload_sampling():
+    """
+    Decide once whether payloads logged inside this block are written, so a sampled
+    request keeps all of its payload lines. Nested blocks reuse the outer decision.
+    """
+    if _payload_sampled.get() is not None:
+        yield
+        return
+    token = _payload_sampled.set(random.random() < _payload_sample_rate())
+    try:
+        yield
+    finally:
+        _payload_sampled.reset(token)
+
+
+def log_payload(logger, msg: str, *args) -> None:
+    """
+    Log a large payload (prompts, model output, request bodies) at INFO for a sampled
+    fraction of calls, controlled by LOG_PAYLOAD_SAMPLE_RATE (0.0-1.0, default 0.01).
+    Pass the payload as a %-style argument so dropped lines are never formatted.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    sampled = _payload_sampled.get()
+    if sampled is None:
+        sampled = random.random() < _payload_sample_rate()
+    with _registry_lock:
+        _log_payloads["sampled" if sampled else "dropped"] += 1
+    if sampled:
+        logger.info(msg, *args)
+
+
+def snapshot() -> Dict[str, object]:
+    with _registry_lock:
+        routes = dict(_routes)
+        stages = dict(_stages)
+        log_payloads = dict(_log_payloads)
+    return {
+        "routes": {name: hist.snapshot() for name, hist in sorted(routes.items())},
+        "stages": {name: hist.snapshot() for name, hist in sorted(stages.items())},
+        "log_payloads": {
+            "sample_rate": _payload_sample_rate(),
+            **log_payloads,
+        },
+    }
@@ -1,8 +1,20 @@
-from pydantic import BaseModel, HttpUrl, field_validator
+from pydantic import BaseModel, HttpUrl, field_validator, model_validator
 from typing import List, Optional
 
+from src.metrics import timed
 
-class IngestRequest(BaseModel):
+
+class TimedRequest(BaseModel):
+    """Base for request bodies; records validation time under the "validation" stage."""
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _timed_validation(cls, data, handler):
+        with timed("validation"):
+            return handler(data)
+
+
+class IngestRequest(TimedRequest):
     name: str
     keywords: List[str]
     image_urls: List[HttpUrl]
@@ -23,7 +35,7 @@ class IngestRequest(BaseModel):
         return v.strip()
 
 
-class GenerateDescriptionRequest(BaseModel):
+class GenerateDescriptionRequest(TimedRequest):
     name: str
     keywords: List[str]
     image_urls: List[HttpUrl]
@@ -46,7 +58,7 @@ class IngestResponse(BaseModel):
     metadata: dict
 
 
-class SearchRequest(BaseModel):
+class SearchRequest(TimedRequest):
     query: str
     top_k: int = 5
 
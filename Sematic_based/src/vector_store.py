@@ -1,10 +1,13 @@
 import os
+from functools import lru_cache
+from typing import Optional
+
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
 
-def get_chroma_client() -> chromadb.Client:
-    persist_dir = os.getenv("CHROMA_DIR", ".chroma")
+def get_chroma_client(persist_dir: Optional[str] = None) -> chromadb.Client:
+    persist_dir = persist_dir or os.getenv("CHROMA_DIR", ".chroma")
     return chromadb.Client(
         Settings(
             persist_directory=persist_dir,
@@ -13,8 +16,14 @@ def get_chroma_client() -> chromadb.Client:
     )
 
 
+@lru_cache(maxsize=1)
+def get_embedding_function():
+    # Same model Chroma uses by default; exposed so callers can time embedding separately.
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
 def get_collection(client: chromadb.Client):
     return client.get_or_create_collection(
-        name="products"
+        name="products",
+        embedding_function=get_embedding_function(),
     )
-
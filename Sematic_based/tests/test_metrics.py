@@ -0,0 +1,70 @@
+import logging
+
+from src import metrics
+from src.metrics import Histogram
+
+
+def test_sub_millisecond_quantiles_are_resolved():
+    hist = Histogram()
+    for _ in range(100):
+        hist.observe(0.00004)
+    snap = hist.snapshot()
+    assert snap["p50"] == 0.00004
+    assert snap["p99"] == 0.00004
+    assert snap["buckets"]["5e-05"] == 100
+
+
+def test_quantile_reports_bucket_bound_capped_at_max():
+    hist = Histogram()
+    for seconds in (0.002, 0.002, 0.002, 0.2):
+        hist.observe(seconds)
+    snap = hist.snapshot()
+    assert snap["p50"] == 0.0025
+    assert snap["p99"] == 0.2
+    assert snap["max"] == 0.2
+
+
+def test_quantile_in_overflow_bucket_uses_max():
+    hist = Histogram()
+    hist.observe(45.0)
+    assert hist.snapshot()["p99"] == 45.0
+
+
+def test_empty_histogram():
+    snap = Histogram().snapshot()
+    assert snap["count"] == 0
+    assert snap["p50"] == 0.0
+
+
+def _payload_lines(caplog):
+    return [r.getMessage() for r in caplog.records if r.name == "test.payload"]
+
+
+def test_payload_sampling_decides_once_per_scope(monkeypatch, caplog):
+    monkeypatch.setenv("LOG_PAYLOAD_SAMPLE_RATE", "0.5")
+    logger = logging.getLogger("test.payload")
+    caplog.set_level(logging.INFO, logger="test.payload")
+    for i in range(200):
+        with metrics.payload_sampling():
+            metrics.log_payload(logger, "A %d", i)
+            with metrics.payload_sampling():
+                metrics.log_payload(logger, "B %d", i)
+
+    lines = _payload_lines(caplog)
+    kept_a = {line[2:] for line in lines if line.startswith("A ")}
+    kept_b = {line[2:] for line in lines if line.startswith("B ")}
+    assert kept_a == kept_b
+    assert 0 < len(kept_a) < 200
+
+
+def test_log_payload_skips_disabled_logger(monkeypatch, caplog):
+    monkeypatch.setenv("LOG_PAYLOAD_SAMPLE_RATE", "1")
+    logger = logging.getLogger("test.payload")
+    caplog.set_level(logging.WARNING, logger="test.payload")
+    before = metrics.snapshot()["log_payloads"]
+    with metrics.payload_sampling():
+        metrics.log_payload(logger, "A %s", "x")
+    after = metrics.snapshot()["log_payloads"]
+    assert _payload_lines(caplog) == []
+    assert after["sampled"] == before["sampled"]
+    assert after["dropped"] == before["dropped"]
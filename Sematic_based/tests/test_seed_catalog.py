@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("chromadb")
+
+from loadtest import seed_catalog as seeding  # noqa: E402
+
+
+class FakeCollection:
+    name = "products"
+
+    def __init__(self):
+        self.ids = []
+
+    def count(self):
+        return len(self.ids)
+
+    def upsert(self, ids, embeddings, documents, metadatas):
+        self.ids.extend(ids)
+
+
+class FakeClient:
+    def __init__(self):
+        self.collection = FakeCollection()
+        self.deleted = 0
+
+    def delete_collection(self, name):
+        self.deleted += 1
+        self.collection = FakeCollection()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(seeding, "get_chroma_client", lambda persist_dir=None: fake)
+    monkeypatch.setattr(seeding, "get_collection", lambda c: c.collection)
+    monkeypatch.setattr(seeding, "get_embedding_function", lambda: lambda docs: [[0.0]] * len(docs))
+    return fake
+
+
+def _seed(path, products, seed=1234):
+    return seeding.seed_catalog(str(path), products, "http://img", seed=seed, batch_size=4)
+
+
+def test_seeds_and_writes_manifest(tmp_path, client):
+    assert _seed(tmp_path, 10) == 10
+    assert client.collection.count() == 10
+    with open(os.path.join(tmp_path, seeding.MANIFEST_NAME)) as fh:
+        assert json.load(fh) == {"products": 10, "image_base": "http://img", "seed": 1234}
+
+
+def test_matching_manifest_is_reused(tmp_path, client):
+    _seed(tmp_path, 10)
+    assert _seed(tmp_path, 10) == 0
+    assert client.deleted == 0
+
+
+def test_mismatch_rebuilds_exactly(tmp_path, client):
+    _seed(tmp_path, 10)
+    assert _seed(tmp_path, 6) == 6
+    assert client.deleted == 1
+    assert client.collection.count() == 6
+
+    client.collection.ids.append("extra")  # e.g. traffic written into the seeded store
+    assert _seed(tmp_path, 6) == 6
+    assert client.collection.count() == 6
+
+
+def test_refuses_to_drop_catalog_without_manifest(tmp_path, client):
+    client.collection.ids.append("real-product")
+    with pytest.raises(seeding.SeedCatalogError):
+        _seed(tmp_path, 10)
+    assert client.deleted == 0
+    assert client.collection.ids == ["real-product"]